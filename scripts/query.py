@@ -40,10 +40,11 @@ def main():
             print(f"{i}. {fmt['title']}")
             print(f"   arXiv: {fmt['arxiv_id']} | Section: {fmt['section']} | Score: {fmt['score']}")
             
-            # Show snippet of text
-            text = result["metadata"].get("text", "")[:200]
-            if len(text) > 0:
-                print(f"   {text}{'...' if len(result['metadata'].get('text', '')) > 200 else ''}")
+            # Show snippet of text (single lookup, single length check)
+            text_full = result["metadata"].get("text", "")
+            if text_full:
+                snippet = text_full[:200]
+                print(f"   {snippet}{'...' if len(text_full) > 200 else ''}")
             print()
         
         logger.info("✅ Vector search completed successfully!")
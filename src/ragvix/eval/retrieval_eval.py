@@ -1,54 +1,54 @@
 """Retrieval evaluation metrics and utilities."""
 
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
 
 from ragvix.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Shared default for queries without ground truth, so cache misses don't
+# allocate a fresh empty set each time
+_EMPTY: frozenset = frozenset()
+
 
-def compute_recall_at_k(
+def recall_precision_at_ks(
     retrieved_ids: List[str],
     relevant_ids: Set[str],
-    k: int = 5
-) -> float:
-    """Compute Recall@k metric.
-    
-    Args:
-        retrieved_ids: List of retrieved document IDs (in order)
-        relevant_ids: Set of relevant document IDs (ground truth)
-        k: Cutoff for evaluation
-        
-    Returns:
-        Recall@k score (0.0 to 1.0)
-    """
-    if not relevant_ids:
-        return 0.0
-    
-    retrieved_at_k = set(retrieved_ids[:k])
-    return len(retrieved_at_k & relevant_ids) / len(relevant_ids)
+    ks: List[int],
+) -> Dict[int, Tuple[float, float]]:
+    """Compute Recall@k and Precision@k for several cutoffs in one pass.
 
+    Builds a first-occurrence hit mask over the top max(ks) results and
+    reads every cutoff out of its cumulative sum, so the cost is one
+    O(max k) scan instead of per-k set intersections. Duplicate chunks
+    from the same paper count once.
 
-def compute_precision_at_k(
-    retrieved_ids: List[str],
-    relevant_ids: Set[str],
-    k: int = 5
-) -> float:
-    """Compute Precision@k metric.
-    
     Args:
         retrieved_ids: List of retrieved document IDs (in order)
         relevant_ids: Set of relevant document IDs (ground truth)
-        k: Cutoff for evaluation
-        
+        ks: Cutoffs to evaluate
+
     Returns:
-        Precision@k score (0.0 to 1.0)
+        Mapping of k -> (recall@k, precision@k)
     """
-    if not retrieved_ids[:k]:
-        return 0.0
-    
-    retrieved_at_k = set(retrieved_ids[:k])
-    return len(retrieved_at_k & relevant_ids) / len(retrieved_at_k)
+    top = retrieved_ids[:max(ks)]
+    seen = set()
+    hits = np.zeros(len(top), dtype=np.int8)
+    for rank, retrieved_id in enumerate(top):
+        if retrieved_id in relevant_ids and retrieved_id not in seen:
+            hits[rank] = 1
+            seen.add(retrieved_id)
+    cum_hits = np.cumsum(hits)
+
+    metrics = {}
+    for k in ks:
+        hit_count = int(cum_hits[min(k, len(cum_hits)) - 1]) if len(cum_hits) else 0
+        recall = hit_count / len(relevant_ids) if relevant_ids else 0.0
+        precision = hit_count / k if top[:k] else 0.0
+        metrics[k] = (recall, precision)
+    return metrics
 
 
 def evaluate_retrieval(
@@ -66,26 +66,31 @@ def evaluate_retrieval(
     Returns:
         Dictionary with evaluation metrics
     """
-    metrics = {f"recall@{k}": [] for k in k_values}
-    metrics.update({f"precision@{k}": [] for k in k_values})
-    
+    sums = {f"recall@{k}": 0.0 for k in k_values}
+    sums.update({f"precision@{k}": 0.0 for k in k_values})
+    num_queries = 0
+
+    # Freeze ground truth once up front instead of per-query set handling
+    gt = {query_id: frozenset(ids) for query_id, ids in ground_truth.items()}
+
     for result in retrieval_results:
         query_id = result["query"]
         retrieved_ids = [hit["metadata"]["arxiv_id"] for hit in result.get("results", [])]
-        relevant_ids = ground_truth.get(query_id, set())
-        
-        for k in k_values:
-            recall = compute_recall_at_k(retrieved_ids, relevant_ids, k)
-            precision = compute_precision_at_k(retrieved_ids, relevant_ids, k)
-            
-            metrics[f"recall@{k}"].append(recall)
-            metrics[f"precision@{k}"].append(precision)
-    
+        relevant_ids = gt.get(query_id, _EMPTY)
+        num_queries += 1
+
+        for k, (recall, precision) in recall_precision_at_ks(
+            retrieved_ids, relevant_ids, k_values
+        ).items():
+            sums[f"recall@{k}"] += recall
+            sums[f"precision@{k}"] += precision
+
     # Compute averages
-    avg_metrics = {}
-    for metric, values in metrics.items():
-        avg_metrics[metric] = sum(values) / len(values) if values else 0.0
-    
+    avg_metrics = {
+        metric: (total / num_queries if num_queries else 0.0)
+        for metric, total in sums.items()
+    }
+
     return avg_metrics
 
 
@@ -117,17 +122,29 @@ def run_seed_evaluation(retriever, k: int = 5) -> Dict:
         Evaluation results
     """
     logger.info("Running seed evaluation (placeholder)")
-    
+
+    queries = list(SEED_EVALUATION_DATA)
     results = []
-    for query, relevant_ids in SEED_EVALUATION_DATA.items():
-        try:
-            search_results = retriever.search(query, k=k)
-            results.append({
-                "query": query,
-                "results": search_results,
-            })
-        except Exception as e:
-            logger.warning(f"Failed to evaluate query '{query}': {e}")
+    try:
+        # One encoder call + one FAISS search for all seed queries
+        if retriever.store is None:
+            retriever.load_index()
+        batch_results = retriever.store.search_batch(queries, k=k)
+        results = [
+            {"query": query, "results": search_results}
+            for query, search_results in zip(queries, batch_results)
+        ]
+    except Exception as e:
+        logger.warning(f"Batched evaluation failed, falling back to per-query search: {e}")
+        for query in queries:
+            try:
+                search_results = retriever.search(query, k=k)
+                results.append({
+                    "query": query,
+                    "results": search_results,
+                })
+            except Exception as e:
+                logger.warning(f"Failed to evaluate query '{query}': {e}")
     
     if not results:
         return {"error": "No evaluation results"}
@@ -1,6 +1,11 @@
 """Text chunking utilities."""
 
-from typing import Dict, List
+import multiprocessing as mp
+import os
+from functools import partial
+from typing import Dict, List, Optional
+
+import numpy as np
 
 from ragvix.utils.logging import get_logger
 
@@ -33,88 +38,147 @@ def chunk_text(
         return []
     
     text = text.strip()
-    chunks = []
-    
+
+    # Fast path: text fits in one chunk, skip the window machinery
+    if len(text) <= chunk_size:
+        return [{
+            "text": text,
+            "metadata": {
+                "arxiv_id": arxiv_id,
+                "title": title,
+                "section": section,
+                "chunk_index": 0,
+                "char_start": 0,
+                "char_end": len(text),
+                "chunk_size": len(text),
+            }
+        }]
+
     # Calculate step size (chunk_size - overlap)
     step = max(chunk_size - overlap, 1)
-    
-    for i in range(0, len(text), step):
-        chunk_text = text[i:i + chunk_size]
-        
-        # Skip very small chunks at the end
-        if len(chunk_text) < chunk_size * 0.1:
-            break
-            
-        chunk_data = {
-            "text": chunk_text,
+
+    # Precompute chunk boundaries at C level instead of looping in Python
+    starts = np.arange(0, len(text), step, dtype=np.int64)
+    ends = np.minimum(starts + chunk_size, len(text))
+
+    # Drop very small chunks at the end
+    keep = (ends - starts) >= chunk_size * 0.1
+
+    chunks = [
+        {
+            "text": text[start:end],
             "metadata": {
                 "arxiv_id": arxiv_id,
                 "title": title,
                 "section": section,
-                "chunk_index": len(chunks),
-                "char_start": i,
-                "char_end": i + len(chunk_text),
-                "chunk_size": len(chunk_text),
+                "chunk_index": index,
+                "char_start": start,
+                "char_end": end,
+                "chunk_size": end - start,
             }
         }
-        chunks.append(chunk_data)
-    
+        for index, (start, end) in enumerate(
+            zip(starts[keep].tolist(), ends[keep].tolist())
+        )
+    ]
+
     logger.info(f"Created {len(chunks)} chunks from {len(text)} characters")
     return chunks
 
 
+def _chunk_one(
+    paper: Dict,
+    chunk_abstracts: bool,
+    chunk_size: int,
+    overlap: int,
+) -> List[Dict]:
+    """Chunk a single paper's abstract.
+
+    Top-level function so it can be pickled into worker processes.
+
+    Args:
+        paper: Paper metadata dictionary
+        chunk_abstracts: Whether to chunk abstracts or use them whole
+        chunk_size: Maximum characters per chunk
+        overlap: Overlap characters between chunks
+
+    Returns:
+        List of chunks for this paper (possibly empty)
+    """
+    if not paper.get("abstract"):
+        return []
+
+    if chunk_abstracts and len(paper["abstract"]) > chunk_size:
+        # Chunk long abstracts
+        return chunk_text(
+            text=paper["abstract"],
+            chunk_size=chunk_size,
+            overlap=overlap,
+            arxiv_id=paper.get("arxiv_id", ""),
+            title=paper.get("title", ""),
+            section="abstract",
+        )
+
+    # Use whole abstract as single chunk
+    return [{
+        "text": paper["abstract"],
+        "metadata": {
+            "arxiv_id": paper.get("arxiv_id", ""),
+            "title": paper.get("title", ""),
+            "section": "abstract",
+            "chunk_index": 0,
+            "char_start": 0,
+            "char_end": len(paper["abstract"]),
+            "chunk_size": len(paper["abstract"]),
+            "authors": paper.get("authors", []),
+            "categories": paper.get("categories", []),
+            "published": paper.get("published", ""),
+        }
+    }]
+
+
 def chunk_papers_from_metadata(
     papers_metadata: List[Dict],
     chunk_abstracts: bool = True,
     chunk_size: int = 1200,
     overlap: int = 120,
+    num_workers: Optional[int] = None,
 ) -> List[Dict]:
     """Chunk paper abstracts from metadata.
-    
+
+    Chunking is a pure function of a single paper, so large corpora are
+    fanned out over a process pool; small ones stay serial to avoid
+    pool startup overhead.
+
     Args:
         papers_metadata: List of paper metadata dictionaries
         chunk_abstracts: Whether to chunk abstracts (True) or use whole abstracts
         chunk_size: Maximum characters per chunk
         overlap: Overlap characters between chunks
-        
+        num_workers: Process count for parallel chunking; defaults to the
+            CPU count. Pass 1 to force the serial path.
+
     Returns:
         List of chunks with metadata
     """
-    all_chunks = []
-    
-    for paper in papers_metadata:
-        if not paper.get("abstract"):
-            continue
-            
-        if chunk_abstracts and len(paper["abstract"]) > chunk_size:
-            # Chunk long abstracts
-            chunks = chunk_text(
-                text=paper["abstract"],
-                chunk_size=chunk_size,
-                overlap=overlap,
-                arxiv_id=paper.get("arxiv_id", ""),
-                title=paper.get("title", ""),
-                section="abstract",
-            )
-            all_chunks.extend(chunks)
-        else:
-            # Use whole abstract as single chunk
-            chunk_data = {
-                "text": paper["abstract"],
-                "metadata": {
-                    "arxiv_id": paper.get("arxiv_id", ""),
-                    "title": paper.get("title", ""),
-                    "section": "abstract",
-                    "chunk_index": 0,
-                    "char_start": 0,
-                    "char_end": len(paper["abstract"]),
-                    "chunk_size": len(paper["abstract"]),
-                    "authors": paper.get("authors", []),
-                    "categories": paper.get("categories", []),
-                    "published": paper.get("published", ""),
-                }
-            }
-            all_chunks.append(chunk_data)
-    
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    chunk_one = partial(
+        _chunk_one,
+        chunk_abstracts=chunk_abstracts,
+        chunk_size=chunk_size,
+        overlap=overlap,
+    )
+
+    all_chunks: List[Dict] = []
+    if num_workers > 1 and len(papers_metadata) >= 1000:
+        with mp.Pool(num_workers) as pool:
+            for chunks in pool.imap(chunk_one, papers_metadata, chunksize=64):
+                all_chunks.extend(chunks)
+    else:
+        for paper in papers_metadata:
+            all_chunks.extend(chunk_one(paper))
+
     logger.info(f"Created {len(all_chunks)} chunks from {len(papers_metadata)} papers")
     return all_chunks
\ No newline at end of file
@@ -1,14 +1,25 @@
 """FAISS vector store for similarity search."""
 
+import hashlib
 import json
+import os
+import sqlite3
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import faiss
 import numpy as np
 import typer
 from sentence_transformers import SentenceTransformer
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # metadata falls back to JSONL persistence
+    pa = None
+    pq = None
+
 from ragvix.config import settings
 from ragvix.utils.io import read_jsonl, write_jsonl
 from ragvix.utils.logging import get_logger
@@ -16,87 +27,503 @@ from ragvix.utils.logging import get_logger
 app = typer.Typer(help="FAISS index management")
 logger = get_logger(__name__)
 
+# Embedding dimensions for common models, so a store can be constructed
+# and an index loaded without paying the encoder's import/init cost
+_KNOWN_DIMS = {
+    "all-MiniLM-L6-v2": 384,
+    "all-MiniLM-L12-v2": 384,
+    "all-mpnet-base-v2": 768,
+    "multi-qa-MiniLM-L6-cos-v1": 384,
+}
+
+
+class _EncoderONNX:
+    """MiniLM encoder running on ONNX Runtime with INT8 dynamic quantization.
+
+    Drop-in replacement for the SentenceTransformer encode path: exports
+    the model once, quantizes it for VNNI, and mean-pools token
+    embeddings in NumPy. Roughly 2-4x faster than FP32 PyTorch on CPU.
+    """
+
+    QUANTIZED_FILE = "model_quantized.onnx"
+
+    def __init__(self, model_name: str):
+        try:
+            import onnxruntime
+            from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+            from transformers import AutoTokenizer
+        except ImportError as e:
+            raise ImportError(
+                "The ONNX encoding backend requires 'optimum[onnxruntime]'. "
+                "Install it or use backend='sentence-transformers'."
+            ) from e
+
+        repo_id = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        export_dir = settings.data_dir / "onnx" / model_name.replace("/", "--")
+
+        # Export + quantize once; later runs reuse the cached model
+        if not (export_dir / self.QUANTIZED_FILE).exists():
+            logger.info(f"Exporting {repo_id} to ONNX with INT8 quantization...")
+            model = ORTModelForFeatureExtraction.from_pretrained(repo_id, export=True)
+            model.save_pretrained(export_dir)
+            quantizer = ORTQuantizer.from_pretrained(export_dir)
+            quantizer.quantize(
+                save_dir=export_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False),
+            )
+
+        self.tokenizer = AutoTokenizer.from_pretrained(repo_id)
+        self.session = onnxruntime.InferenceSession(str(export_dir / self.QUANTIZED_FILE))
+        self.dimension = int(self.session.get_outputs()[0].shape[-1])
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def encode(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        normalize_embeddings: bool = False,
+        **_,
+    ) -> np.ndarray:
+        """Encode texts into mean-pooled embeddings.
+
+        Args:
+            texts: Input texts
+            batch_size: Number of texts per ONNX session call
+            normalize_embeddings: Whether to L2-normalize the output rows
+
+        Returns:
+            float32 array of shape (len(texts), dimension)
+        """
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        input_names = {inp.name for inp in self.session.get_inputs()}
+
+        # Batches are padded to their longest member, so group texts of
+        # similar length together and scatter results back afterwards
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        sorted_texts = [texts[i] for i in order]
+
+        for start in range(0, len(sorted_texts), batch_size):
+            encoded = self.tokenizer(
+                sorted_texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                return_tensors="np",
+            )
+            feed = {k: v for k, v in encoded.items() if k in input_names}
+            hidden = self.session.run(None, feed)[0]
+
+            # Mean pooling over non-padding tokens
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+            embeddings[order[start:start + len(pooled)]] = pooled
+
+        if normalize_embeddings:
+            embeddings /= np.maximum(
+                np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12
+            )
+
+        return embeddings
+
+
+def choose_index_factory_key(num_vectors: int) -> str:
+    """Pick a compressed index type sized to the corpus.
+
+    Flat FP32 search is memory-bound, so quantizing vectors directly
+    increases scan throughput. Small corpora get an exhaustive 8-bit
+    scalar quantizer (4x fewer bytes per scan, recall loss ~1-2%);
+    million-scale corpora get IVF with product quantization.
+
+    Args:
+        num_vectors: Expected number of vectors in the index
+
+    Returns:
+        faiss index_factory description string
+    """
+    if num_vectors < 1_000_000:
+        return "SQ8"
+    return "IVF1024,PQ32"
+
+
+class _ColumnarMetadata:
+    """Struct-of-arrays view over chunk metadata.
+
+    Keeps one Python list per column and materializes row dicts on
+    demand, so loading millions of rows avoids per-row dict overhead.
+    Supports len() and integer indexing like the list it replaces.
+    """
+
+    def __init__(self, columns: Dict[str, List]):
+        self.columns = columns
+        self._num_rows = len(next(iter(columns.values()))) if columns else 0
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def __getitem__(self, idx: int) -> Dict:
+        # Skip nulls so rows look like the original sparse dicts
+        return {
+            name: values[idx]
+            for name, values in self.columns.items()
+            if values[idx] is not None
+        }
+
+
+class _EmbeddingCache:
+    """SQLite-backed cache of chunk embeddings keyed by content hash.
+
+    Embeddings are deterministic in (model, text), so rebuilding an index
+    only pays the encoder forward pass for chunks it has never seen.
+    """
+
+    def __init__(self, path: Path, model_name: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Personalize hashes with the model so caches never mix models
+        self._person = hashlib.blake2b(model_name.encode(), digest_size=16).digest()
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, emb BLOB)"
+        )
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.blake2b(
+            text.encode(), digest_size=16, person=self._person
+        ).digest()
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        row = self.conn.execute(
+            "SELECT emb FROM embeddings WHERE key = ?", (self._key(text),)
+        ).fetchone()
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def put_many(self, texts: List[str], embeddings: np.ndarray) -> None:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, emb) VALUES (?, ?)",
+            [
+                (self._key(text), embedding.tobytes())
+                for text, embedding in zip(texts, embeddings)
+            ],
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
 
 class FAISSStore:
     """FAISS-based vector store for similarity search."""
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        index_factory_key: str = "HNSW32",
+        backend: str = "sentence-transformers",
+    ):
         """Initialize FAISS store with embedding model.
-        
+
         Args:
             model_name: Name of sentence-transformers model
+            index_factory_key: faiss index_factory description (e.g. "HNSW32",
+                "IVF1024,Flat", "Flat"). HNSW trades ~2% recall for an
+                order-of-magnitude query speedup over a flat scan at scale.
+                "auto" picks a quantized index sized to the corpus at
+                build time via choose_index_factory_key.
+            backend: Encoder backend, "sentence-transformers" (default) or
+                "onnx" for the INT8-quantized ONNX Runtime path
         """
+        # Default OMP thread count can be 1 inside containers; set it
+        # explicitly so HNSW/IVF add and search paths parallelize
+        faiss.omp_set_num_threads(os.cpu_count() or 4)
+
         self.model_name = model_name
-        self.model = SentenceTransformer(model_name)
+        self.backend = backend
+        self._model = None
         self.index: Optional[faiss.Index] = None
-        self.metadata: List[Dict] = []
-        self.dimension = self.model.get_sentence_embedding_dimension()
+        self.index_factory_key = index_factory_key
+        self.emb_cache_path = settings.index_dir / "emb_cache.sqlite"
+        self.metadata: Union[List[Dict], _ColumnarMetadata] = []
+        # Unknown models fall through to the encoder for the dimension
+        self.dimension = _KNOWN_DIMS.get(model_name)
+        if self.dimension is None:
+            self.dimension = self.model.get_sentence_embedding_dimension()
+
+    @property
+    def model(self):
+        """Encoder, constructed on first use.
+
+        Loading an index and never encoding (e.g. inspecting metadata)
+        skips the multi-second model initialization entirely.
+        """
+        if self._model is None:
+            if self.backend == "onnx":
+                self._model = _EncoderONNX(self.model_name)
+            else:
+                self._model = SentenceTransformer(self.model_name)
+        return self._model
     
-    def build_index(self, chunks: List[Dict]) -> None:
+    def build_index(
+        self,
+        chunks: List[Dict],
+        batch_size: int = 4096,
+        use_cache: bool = True,
+    ) -> None:
         """Build FAISS index from text chunks.
-        
+
+        Embeddings are streamed through a disk-backed buffer in
+        mini-batches, so peak RAM is O(batch) instead of O(N * dim).
+        Previously seen chunks are served from an on-disk embedding
+        cache, so rebuilds only encode new or changed text.
+
         Args:
             chunks: List of chunk dictionaries with 'text' and 'metadata'
+            batch_size: Number of chunks encoded per mini-batch
+            use_cache: Whether to use the persistent embedding cache
         """
         if not chunks:
             logger.warning("No chunks provided for indexing")
             return
-        
-        logger.info(f"Building FAISS index from {len(chunks)} chunks")
+
+        num_chunks = len(chunks)
+        logger.info(f"Building FAISS index from {num_chunks} chunks")
         logger.info(f"Using model: {self.model_name} (dim={self.dimension})")
-        
+
         # Extract texts for embedding
         texts = [chunk["text"] for chunk in chunks]
-        
-        # Generate embeddings
-        logger.info("Generating embeddings...")
-        embeddings = self.model.encode(texts, show_progress_bar=True)
-        embeddings = embeddings.astype(np.float32)
-        
-        # Create FAISS index (Inner Product for cosine similarity)
-        self.index = faiss.IndexFlatIP(self.dimension)
-        
-        # Normalize embeddings for cosine similarity
-        faiss.normalize_L2(embeddings)
-        
-        # Add to index
-        self.index.add(embeddings)
-        
-        # Store metadata
         self.metadata = [chunk["metadata"] for chunk in chunks]
-        
+
+        # Resolve "auto" to a quantized index sized to this corpus
+        if self.index_factory_key == "auto":
+            self.index_factory_key = choose_index_factory_key(num_chunks)
+            logger.info(f"Auto-selected index type: {self.index_factory_key}")
+
+        # Create FAISS index (Inner Product for cosine similarity)
+        self.index = faiss.index_factory(
+            self.dimension, self.index_factory_key, faiss.METRIC_INNER_PRODUCT
+        )
+
+        # Disk-backed embedding buffer; only re-read when the index needs
+        # training (the second add pass pages it back in from disk)
+        tmp_fd, tmp_path = tempfile.mkstemp(suffix=".embeddings.f32")
+        os.close(tmp_fd)
+        try:
+            embeddings = np.memmap(
+                tmp_path,
+                dtype="float32",
+                mode="w+",
+                shape=(num_chunks, self.dimension),
+            )
+
+            cache = _EmbeddingCache(self.emb_cache_path, self.model_name) if use_cache else None
+            try:
+                logger.info("Generating embeddings...")
+                for start in range(0, num_chunks, batch_size):
+                    batch = self._encode_batch(texts[start:start + batch_size], cache)
+                    embeddings[start:start + len(batch)] = batch
+                    if self.index.is_trained:
+                        self.index.add(batch)
+                    logger.info(
+                        f"Encoded {min(start + batch_size, num_chunks)}/{num_chunks} chunks"
+                    )
+            finally:
+                if cache is not None:
+                    cache.close()
+            del texts
+
+            # IVF-family indexes need training before vectors can be added
+            if not self.index.is_trained:
+                self._train(embeddings)
+                for start in range(0, num_chunks, batch_size):
+                    self.index.add(np.asarray(embeddings[start:start + batch_size]))
+
+            del embeddings
+        finally:
+            os.unlink(tmp_path)
+
+        self._apply_search_tunables()
+
         logger.info(f"Index built with {self.index.ntotal} vectors")
-    
+
+    def _encode_batch(
+        self, batch_texts: List[str], cache: Optional[_EmbeddingCache]
+    ) -> np.ndarray:
+        """Encode one batch of texts, serving hits from the embedding cache.
+
+        Args:
+            batch_texts: Texts to encode
+            cache: Open embedding cache, or None to always encode
+
+        Returns:
+            Normalized float32 embeddings, one row per text
+        """
+        batch = np.empty((len(batch_texts), self.dimension), dtype=np.float32)
+        if cache is None:
+            miss_positions = list(range(len(batch_texts)))
+            miss_texts = batch_texts
+        else:
+            miss_positions, miss_texts = [], []
+            for position, text in enumerate(batch_texts):
+                cached = cache.get(text)
+                if cached is None:
+                    miss_positions.append(position)
+                    miss_texts.append(text)
+                else:
+                    batch[position] = cached
+
+        if miss_texts:
+            # Normalize inside the encoder (cached rows are pre-normalized);
+            # avoids a second full-matrix allocation from astype + normalize
+            encoded = self.model.encode(
+                miss_texts,
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
+            if encoded.dtype != np.float32:
+                encoded = np.ascontiguousarray(encoded, dtype=np.float32)
+            batch[miss_positions] = encoded
+            if cache is not None:
+                cache.put_many(miss_texts, encoded)
+
+        return batch
+
+    def _train(self, embeddings: np.ndarray) -> None:
+        """Train the index on a random sample of the embeddings.
+
+        Args:
+            embeddings: Normalized float32 embedding matrix
+        """
+        try:
+            nlist = faiss.extract_index_ivf(self.index).nlist
+        except RuntimeError:
+            nlist = 1024  # non-IVF trainable index (e.g. scalar quantizer)
+        sample_size = min(len(embeddings), 256 * nlist)
+        sample = embeddings[
+            np.random.choice(len(embeddings), sample_size, replace=False)
+        ]
+        logger.info(f"Training {self.index_factory_key} on {sample_size} vectors")
+        self.index.train(sample)
+
+    def _apply_search_tunables(self) -> None:
+        """Set query-time speed/recall knobs for approximate indexes."""
+        if self.index is None:
+            return
+        if hasattr(self.index, "hnsw"):
+            self.index.hnsw.efSearch = 64
+        try:
+            ivf = faiss.extract_index_ivf(self.index)
+        except RuntimeError:
+            return  # not an IVF index
+        ivf.nprobe = 16
+        # Parallelize over queries within one search call
+        ivf.parallel_mode = 1
+
+    def to_gpu(self, device: int = 0) -> bool:
+        """Move the index to a GPU for batch-query workloads.
+
+        Worth it for large indexes queried in batches (evaluation, bulk
+        QA); small indexes stay on CPU where transfer overhead would
+        dominate.
+
+        Args:
+            device: CUDA device ordinal
+
+        Returns:
+            True if the index was moved to the GPU
+        """
+        if self.index is None:
+            raise ValueError("Index not built. Call build_index() first.")
+
+        import torch
+
+        if not torch.cuda.is_available() or self.index.ntotal <= 100_000:
+            return False
+        if not hasattr(faiss, "StandardGpuResources"):
+            logger.warning("faiss is built without GPU support")
+            return False
+
+        res = faiss.StandardGpuResources()
+        self.index = faiss.index_cpu_to_gpu(res, device, self.index)
+        # Keep the GPU resources alive as long as the index
+        self._gpu_res = res
+        logger.info(f"Index moved to GPU {device}")
+        return True
+
     def search(self, query: str, k: int = 5) -> List[Dict]:
         """Search for similar chunks.
-        
+
         Args:
             query: Search query text
             k: Number of results to return
-            
+
         Returns:
             List of search results with scores and metadata
         """
+        return self.search_batch([query], k=k)[0]
+
+    def search_batch(self, queries: List[str], k: int = 5) -> List[List[Dict]]:
+        """Search for similar chunks for several queries at once.
+
+        Encodes all queries in one model call and issues a single FAISS
+        search, amortizing per-call encoder and index overhead.
+
+        Args:
+            queries: Search query texts
+            k: Number of results to return per query
+
+        Returns:
+            One result list per query, each with scores and metadata
+        """
         if self.index is None:
             raise ValueError("Index not built. Call build_index() first.")
-        
-        # Embed query
-        query_embedding = self.model.encode([query]).astype(np.float32)
-        faiss.normalize_L2(query_embedding)
-        
-        # Search
-        scores, indices = self.index.search(query_embedding, k)
-        
-        results = []
-        for score, idx in zip(scores[0], indices[0]):
-            if idx != -1:  # Valid result
-                result = {
-                    "score": float(score),
-                    "metadata": self.metadata[idx],
-                }
-                results.append(result)
-        
-        return results
+
+        # Embed all queries in one pass, normalized by the encoder
+        query_embeddings = self.model.encode(
+            queries,
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        if query_embeddings.dtype != np.float32:
+            query_embeddings = np.ascontiguousarray(query_embeddings, dtype=np.float32)
+
+        return self.search_embedded(query_embeddings, k=k)
+
+    def search_embedded(self, query_embeddings: np.ndarray, k: int = 5) -> List[List[Dict]]:
+        """Search with precomputed, normalized query embeddings.
+
+        Lets callers that cache query embeddings skip the encoder.
+
+        Args:
+            query_embeddings: float32 array of shape (num_queries, dim)
+            k: Number of results to return per query
+
+        Returns:
+            One result list per query, each with scores and metadata
+        """
+        if self.index is None:
+            raise ValueError("Index not built. Call build_index() first.")
+
+        # Single batched search
+        scores, indices = self.index.search(query_embeddings, k)
+
+        all_results = []
+        for query_scores, query_indices in zip(scores, indices):
+            results = []
+            for score, idx in zip(query_scores, query_indices):
+                if idx != -1:  # Valid result
+                    result = {
+                        "score": float(score),
+                        "metadata": self.metadata[idx],
+                    }
+                    results.append(result)
+            all_results.append(results)
+
+        return all_results
     
     def save(self, index_path: Path) -> None:
         """Save index and metadata to disk.
@@ -113,14 +540,24 @@ class FAISSStore:
         faiss_file = index_path / "faiss.index"
         faiss.write_index(self.index, str(faiss_file))
         
-        # Save metadata
-        meta_file = index_path / "meta.jsonl"
-        write_jsonl(self.metadata, meta_file)
+        # Save metadata; Parquet is columnar and decodes 5-10x faster on
+        # load than JSONL, which stays as the fallback without pyarrow
+        if pa is not None:
+            if isinstance(self.metadata, _ColumnarMetadata):
+                table = pa.table(self.metadata.columns)
+            else:
+                table = pa.Table.from_pylist(self.metadata)
+            pq.write_table(table, index_path / "meta.parquet")
+        else:
+            meta_file = index_path / "meta.jsonl"
+            write_jsonl(self.metadata, meta_file)
         
         # Save config
         config = {
             "model_name": self.model_name,
             "dimension": self.dimension,
+            "index_factory_key": self.index_factory_key,
+            "emb_cache_path": str(self.emb_cache_path),
             "num_vectors": self.index.ntotal,
         }
         config_file = index_path / "config.json"
@@ -129,11 +566,14 @@ class FAISSStore:
         
         logger.info(f"Index saved to {index_path}")
     
-    def load(self, index_path: Path) -> None:
+    def load(self, index_path: Path, mmap: bool = False) -> None:
         """Load index and metadata from disk.
-        
+
         Args:
             index_path: Directory containing index files
+            mmap: Memory-map the index instead of reading it into RAM.
+                The OS pages vectors in on demand and shares them across
+                processes; mainly useful for Flat/IVF-family indexes.
         """
         # Load config
         config_file = index_path / "config.json"
@@ -144,31 +584,61 @@ class FAISSStore:
         if config["model_name"] != self.model_name:
             logger.warning(f"Model mismatch: {config['model_name']} vs {self.model_name}")
         
+        # Older indexes predate configurable index types and were Flat
+        self.index_factory_key = config.get("index_factory_key", "Flat")
+        self.dimension = config.get("dimension", self.dimension)
+
         # Load FAISS index
         faiss_file = index_path / "faiss.index"
-        self.index = faiss.read_index(str(faiss_file))
-        
-        # Load metadata
-        meta_file = index_path / "meta.jsonl"
-        self.metadata = read_jsonl(meta_file)
+        if mmap:
+            try:
+                self.index = faiss.read_index(
+                    str(faiss_file), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                )
+                # Searches touch the mapping randomly; tell the kernel
+                if hasattr(os, "posix_fadvise"):
+                    fd = os.open(str(faiss_file), os.O_RDONLY)
+                    try:
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_RANDOM)
+                    finally:
+                        os.close(fd)
+            except RuntimeError as e:
+                # Not all index types support mmapped IO (e.g. HNSW)
+                logger.warning(f"mmap load failed ({e}), reading index into RAM")
+                self.index = faiss.read_index(str(faiss_file))
+        else:
+            self.index = faiss.read_index(str(faiss_file))
+        self._apply_search_tunables()
+
+        # Load metadata, preferring the columnar Parquet layout
+        parquet_file = index_path / "meta.parquet"
+        if pa is not None and parquet_file.exists():
+            table = pq.read_table(parquet_file)
+            self.metadata = _ColumnarMetadata(
+                {name: table.column(name).to_pylist() for name in table.column_names}
+            )
+        else:
+            meta_file = index_path / "meta.jsonl"
+            self.metadata = read_jsonl(meta_file)
         
         logger.info(f"Index loaded: {len(self.metadata)} vectors")
 
 
-def load_index(index_path: Optional[Path] = None) -> FAISSStore:
+def load_index(index_path: Optional[Path] = None, mmap: bool = False) -> FAISSStore:
     """Load FAISS index from standard location.
-    
+
     Args:
         index_path: Optional custom index path
-        
+        mmap: Memory-map the index instead of reading it into RAM
+
     Returns:
         Loaded FAISS store
     """
     if index_path is None:
         index_path = settings.index_dir
-    
+
     store = FAISSStore(settings.embedding_model)
-    store.load(index_path)
+    store.load(index_path, mmap=mmap)
     return store
 
 
@@ -176,6 +646,10 @@ def load_index(index_path: Optional[Path] = None) -> FAISSStore:
 def build(
     chunks: str = typer.Option("data/processed/chunks.jsonl", help="Input chunks file"),
     out: str = typer.Option("data/index", help="Output directory for index"),
+    index_key: str = typer.Option(
+        "HNSW32",
+        help="faiss index_factory key, or 'auto' for a corpus-sized quantized index",
+    ),
 ) -> None:
     """Build FAISS index from chunks."""
     chunks_path = Path(chunks)
@@ -192,7 +666,7 @@ def build(
         logger.info(f"Loaded {len(chunk_data)} chunks")
         
         # Build index
-        store = FAISSStore(settings.embedding_model)
+        store = FAISSStore(settings.embedding_model, index_factory_key=index_key)
         store.build_index(chunk_data)
         
         # Save index
@@ -37,7 +37,11 @@ def fetch_arxiv_metadata(
         sort_by=arxiv.SortCriterion.SubmittedDate,
         sort_order=arxiv.SortOrder.Descending,
     )
-    
+
+    # Explicit client with large pages so results arrive 100 per HTTP
+    # round-trip instead of the small default, with retries on failures
+    client = arxiv.Client(page_size=100, num_retries=3)
+
     papers = []
     
     with Progress(
@@ -47,9 +51,9 @@ def fetch_arxiv_metadata(
     ) as progress:
         task = progress.add_task("Fetching papers...", total=None)
         
-        for result in search.results():
+        for result in client.results(search):
             paper_data = {
-                "arxiv_id": result.entry_id.split("/")[-1],
+                "arxiv_id": result.entry_id.rsplit("/", 1)[-1],
                 "title": result.title,
                 "authors": [author.name for author in result.authors],
                 "abstract": result.summary,
@@ -59,7 +63,8 @@ def fetch_arxiv_metadata(
             }
             papers.append(paper_data)
             
-            if len(papers) % 10 == 0:
+            # Rich progress updates are not free; throttle inside the loop
+            if len(papers) % 100 == 0:
                 progress.update(task, description=f"Fetched {len(papers)} papers...")
     
     logger.info(f"Successfully fetched {len(papers)} papers")
@@ -106,10 +111,7 @@ def fetch(
         logger.info(f"Saved {len(papers)} papers to {out}")
         
         # Log summary statistics
-        categories = set()
-        for paper in papers:
-            categories.update(paper["categories"])
-        
+        categories = {cat for paper in papers for cat in paper["categories"]}
         logger.info(f"Categories found: {', '.join(sorted(categories))}")
         logger.info(f"Date range: {papers[-1]['published'][:10]} to {papers[0]['published'][:10]}")
         
@@ -1,124 +1,371 @@
 """Retrieval interface for RAGvix."""
 
+import copy
 import json
+import logging
+import operator
+import sys
+import unicodedata
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
+import numpy as np
 import typer
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback for CLI output
+    orjson = None
+
 from ragvix.config import settings
 from ragvix.index.faiss_store import FAISSStore, load_index
 from ragvix.utils.logging import get_logger
+from ragvix.utils.query_cache import QueryEmbeddingCache
 
 app = typer.Typer(help="Vector search and retrieval")
 logger = get_logger(__name__)
 
+# Interned fallbacks and a prebound extractor for the hot formatting loop
+_UNKNOWN_TITLE = sys.intern("Unknown Title")
+_UNKNOWN = sys.intern("unknown")
+_META_FIELDS = operator.itemgetter("title", "arxiv_id", "section")
+
+
+def _canon(query: str) -> str:
+    """Canonical cache key for a query.
+
+    NFKC-normalized, lowercased, whitespace-collapsed, so trivially
+    different spellings of the same query share cache entries.
+    """
+    return " ".join(unicodedata.normalize("NFKC", query).lower().split())
+
 
 class Retriever:
     """Main retrieval interface."""
     
-    def __init__(self, index_path: Optional[Path] = None):
+    def __init__(
+        self,
+        index_path: Optional[Path] = None,
+        mmap: bool = False,
+        canonicalize_queries: bool = True,
+    ):
         """Initialize retriever with FAISS store.
-        
+
         Args:
             index_path: Path to FAISS index directory
+            mmap: Memory-map the FAISS index instead of loading it into
+                RAM; near-instant startup and shared pages across worker
+                processes (effective for Flat/IVF-family indexes)
+            canonicalize_queries: Key the query caches on a canonical
+                form (NFKC, lowercased, whitespace-collapsed) so near-
+                duplicate queries share entries; the original query text
+                is still what gets embedded on a miss
         """
         self.index_path = index_path or settings.index_dir
+        self.mmap = mmap
+        self.canonicalize_queries = canonicalize_queries
         self.store: Optional[FAISSStore] = None
+        # Snapshot settings fields touched per search; Pydantic attribute
+        # access is not free on hot paths
+        self._model_name = settings.embedding_model
+        self._doc_count = 0
+        # Bounded LRU caches: repeated queries dominate real workloads,
+        # so hits skip the encoder and the FAISS probe entirely
+        self._result_cache: OrderedDict = OrderedDict()
+        self._result_cache_max = 1024
+        self._emb_cache: OrderedDict = OrderedDict()
+        self._emb_cache_max = 1024
+        # Disk-backed embedding cache, opened with the index; persists
+        # the long-tail query embeddings across process restarts
+        self._query_cache: Optional[QueryEmbeddingCache] = None
     
     def load_index(self) -> None:
         """Load the FAISS index."""
         if not (self.index_path / "config.json").exists():
             raise FileNotFoundError(f"No index found at {self.index_path}")
         
-        self.store = load_index(self.index_path)
-        logger.info(f"Loaded index with {len(self.store.metadata)} documents")
+        self.store = load_index(self.index_path, mmap=self.mmap)
+        self._query_cache = QueryEmbeddingCache(
+            self.index_path / "query_cache.sqlite", self._model_name
+        )
+        self._doc_count = len(self.store.metadata)
+        # Guard so the f-string isn't built when INFO is disabled
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Loaded index with {len(self.store.metadata)} documents")
     
-    def search(self, query: str, k: int = 5) -> List[Dict]:
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Embed a query, serving repeats from a bounded LRU cache.
+
+        Cached embeddings are shared across different k values. Cache
+        keys are canonicalized (unless disabled) so e.g. "Transformers"
+        and " transformers " resolve to one entry; the embedding itself
+        is always computed from the query as given.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Normalized float32 embedding of shape (1, dim)
+        """
+        key = _canon(query) if self.canonicalize_queries else query
+        embedding = self._emb_cache.get(key)
+        if embedding is not None:
+            self._emb_cache.move_to_end(key)
+            return embedding
+
+        # In-memory miss: probe the persistent cache before encoding
+        if self._query_cache is not None:
+            embedding = self._query_cache.get(key)
+
+        if embedding is None:
+            embedding = self.store.model.encode(
+                [query], convert_to_numpy=True, normalize_embeddings=True
+            )
+            if embedding.dtype != np.float32:
+                embedding = np.ascontiguousarray(embedding, dtype=np.float32)
+            if self._query_cache is not None:
+                self._query_cache.put(key, embedding)
+
+        self._emb_cache[key] = embedding
+        if len(self._emb_cache) > self._emb_cache_max:
+            self._emb_cache.popitem(last=False)
+        return embedding
+
+    def search(
+        self,
+        query: str,
+        k: int = 5,
+        format_display: bool = True,
+        flat: bool = False,
+    ) -> List[Dict]:
         """Search for relevant documents.
-        
+
         Args:
             query: Search query
             k: Number of results to return
-            
+            format_display: Attach the human-readable display fields;
+                pass False for machine consumers (e.g. JSON output) to
+                skip building and serializing redundant payload
+            flat: Put display fields directly on each result (title,
+                arxiv_id, section, score_str) instead of nesting them
+                under 'formatted'; flat dicts build in one update call
+                and serialize faster
+
         Returns:
             List of search results with scores and metadata
         """
         if self.store is None:
             self.load_index()
-        
-        results = self.store.search(query, k=k)
-        
-        # Enhance results with formatted output
+
+        key = _canon(query) if self.canonicalize_queries else query
+        cache_key = (key, k, format_display, flat)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            # Deep copy so callers can't mutate the cached entry
+            return copy.deepcopy(cached)
+
+        results = self.store.search_embedded(self._embed_query(query), k=k)[0]
+        if format_display:
+            results = self._format_results(results, flat=flat)
+
+        self._result_cache[cache_key] = copy.deepcopy(results)
+        if len(self._result_cache) > self._result_cache_max:
+            self._result_cache.popitem(last=False)
+
+        return results
+
+    def isearch(self, query: str, k: int = 5) -> Iterator[Dict]:
+        """Search, yielding formatted results one at a time.
+
+        Lazy counterpart to search() for consumers that page through
+        results (e.g. console printing): each hit is formatted as it is
+        consumed, so peak memory stays O(1) in k instead of
+        materializing the enriched list up front. Bypasses the result
+        cache; callers needing cached lists should use search().
+
+        Args:
+            query: Search query
+            k: Number of results to return
+
+        Yields:
+            Search results with the 'formatted' dict attached, in
+            descending score order
+        """
+        if self.store is None:
+            self.load_index()
+
+        results = self.store.search_embedded(self._embed_query(query), k=k)[0]
+        for result in results:
+            yield self._format_result(result)
+
+    def search_batch(self, queries: List[str], k: int = 5) -> List[List[Dict]]:
+        """Search for relevant documents for several queries at once.
+
+        All queries go through one encoder call and one FAISS search,
+        hitting its internal batched matmul path instead of nq=1 probes.
+
+        Args:
+            queries: Search queries
+            k: Number of results to return per query
+
+        Returns:
+            One result list per query, with scores and metadata
+        """
+        if self.store is None:
+            self.load_index()
+
+        batch_results = self.store.search_batch(queries, k=k)
+        return [self._format_results(results) for results in batch_results]
+
+    @staticmethod
+    def _format_results(results: List[Dict], flat: bool = False) -> List[Dict]:
+        """Return results with the human-readable display fields attached.
+
+        Fields come out through one prebound itemgetter instead of four
+        bound .get calls per hit; format() skips the f-string machinery
+        for the score. Rows missing any field fall back to .get.
+
+        With flat=True the fields land directly on the result dict via
+        one update() call (score_str alongside the numeric score)
+        instead of allocating a nested 'formatted' dict per hit.
+        """
+        if not flat:
+            return [Retriever._format_result(result) for result in results]
         for result in results:
             meta = result["metadata"]
-            result["formatted"] = {
-                "title": meta.get("title", "Unknown Title"),
-                "arxiv_id": meta.get("arxiv_id", "unknown"),
-                "section": meta.get("section", "unknown"),
-                "score": f"{result['score']:.4f}",
-            }
-        
+            try:
+                title, arxiv_id, section = _META_FIELDS(meta)
+            except KeyError:
+                title = meta.get("title", _UNKNOWN_TITLE)
+                arxiv_id = meta.get("arxiv_id", _UNKNOWN)
+                section = meta.get("section", _UNKNOWN)
+            result.update(
+                title=title,
+                arxiv_id=arxiv_id,
+                section=section,
+                score_str=format(result["score"], ".4f"),
+            )
         return results
-    
-    def search_with_context(self, query: str, k: int = 5) -> Dict:
+
+    @staticmethod
+    def _format_result(result: Dict) -> Dict:
+        """Return one result with the nested 'formatted' dict attached."""
+        meta = result["metadata"]
+        try:
+            title, arxiv_id, section = _META_FIELDS(meta)
+        except KeyError:
+            title = meta.get("title", _UNKNOWN_TITLE)
+            arxiv_id = meta.get("arxiv_id", _UNKNOWN)
+            section = meta.get("section", _UNKNOWN)
+        return {
+            **result,
+            "formatted": {
+                "title": title,
+                "arxiv_id": arxiv_id,
+                "section": section,
+                "score": format(result["score"], ".4f"),
+            },
+        }
+
+    def search_with_context(
+        self, query: str, k: int = 5, format_display: bool = False, flat: bool = False
+    ) -> Dict:
         """Search with additional context information.
-        
+
         Args:
             query: Search query
             k: Number of results
-            
+            format_display: Attach the human-readable display fields
+                per result; off by default since this path feeds JSON
+                consumers
+            flat: With format_display, put display fields directly on
+                each result instead of nesting under 'formatted'
+
         Returns:
             Dictionary with results and metadata
         """
-        results = self.search(query, k=k)
+        results = self.search(query, k=k, format_display=format_display, flat=flat)
         
         return {
             "query": query,
             "num_results": len(results),
             "results": results,
             "index_stats": {
-                "total_documents": len(self.store.metadata) if self.store else 0,
-                "model": settings.embedding_model,
+                "total_documents": self._doc_count,
+                "model": self._model_name,
             }
         }
 
 
+def _print_json(obj) -> None:
+    """Pretty-print an object as JSON on stdout.
+
+    orjson pretty-prints in C and emits bytes directly, an order of
+    magnitude faster than stdlib json for large result payloads.
+    """
+    if orjson is not None:
+        sys.stdout.buffer.write(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(obj, indent=2, ensure_ascii=False))
+
+
 @app.command()
 def search(
     query: str = typer.Argument(..., help="Search query"),
     k: int = typer.Option(5, help="Number of results to return"),
     index_path: Optional[str] = typer.Option(None, help="Path to index directory"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    flat: bool = typer.Option(
+        False,
+        "--flat",
+        help="With --json, include display fields (title, arxiv_id, section, score_str) flat on each result",
+    ),
+    mmap: bool = typer.Option(False, "--mmap", help="Memory-map the index instead of loading it"),
+    case_sensitive: bool = typer.Option(
+        False,
+        "--case-sensitive",
+        help="Disable query canonicalization for cache keys (by default casing and extra whitespace are ignored)",
+    ),
 ) -> None:
     """Search for relevant documents."""
     try:
         # Initialize retriever
-        retriever = Retriever(Path(index_path) if index_path else None)
+        retriever = Retriever(
+            Path(index_path) if index_path else None,
+            mmap=mmap,
+            canonicalize_queries=not case_sensitive,
+        )
         
         # Perform search
         if json_output:
-            results = retriever.search_with_context(query, k=k)
-            print(json.dumps(results, indent=2, ensure_ascii=False))
+            results = retriever.search_with_context(query, k=k, format_display=flat, flat=flat)
+            _print_json(results)
         else:
-            results = retriever.search(query, k=k)
-            
             print(f"\n🔍 Search: '{query}'\n")
-            
-            if not results:
-                print("No results found.")
-                return
-            
-            for i, result in enumerate(results, 1):
+
+            # Stream results as they are formatted instead of
+            # materializing the enriched list
+            i = 0
+            for i, result in enumerate(retriever.isearch(query, k=k), 1):
                 fmt = result["formatted"]
                 print(f"{i}. {fmt['title']}")
                 print(f"   arXiv: {fmt['arxiv_id']} | Section: {fmt['section']} | Score: {fmt['score']}")
-                
-                # Show snippet of text
-                text = result["metadata"].get("text", "")[:200]
-                if len(text) > 0:
-                    print(f"   {text}{'...' if len(result['metadata'].get('text', '')) > 200 else ''}")
+
+                # Show snippet of text (single lookup, single length check)
+                text_full = result["metadata"].get("text", "")
+                if text_full:
+                    snippet = text_full[:200]
+                    print(f"   {snippet}{'...' if len(text_full) > 200 else ''}")
                 print()
+
+            if i == 0:
+                print("No results found.")
         
     except FileNotFoundError as e:
         logger.error(str(e))
@@ -129,5 +376,49 @@ def search(
         raise typer.Exit(1)
 
 
+@app.command("search-batch")
+def search_batch(
+    queries_file: str = typer.Argument(..., help="File with one query per line"),
+    k: int = typer.Option(5, help="Number of results to return per query"),
+    index_path: Optional[str] = typer.Option(None, help="Path to index directory"),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    mmap: bool = typer.Option(False, "--mmap", help="Memory-map the index instead of loading it"),
+) -> None:
+    """Search for relevant documents for a batch of queries."""
+    try:
+        with open(queries_file, "r", encoding="utf-8") as f:
+            queries = [line.strip() for line in f if line.strip()]
+
+        if not queries:
+            logger.error(f"No queries found in {queries_file}")
+            raise typer.Exit(1)
+
+        retriever = Retriever(Path(index_path) if index_path else None, mmap=mmap)
+        batch_results = retriever.search_batch(queries, k=k)
+
+        if json_output:
+            output = [
+                {"query": query, "num_results": len(results), "results": results}
+                for query, results in zip(queries, batch_results)
+            ]
+            _print_json(output)
+        else:
+            for query, results in zip(queries, batch_results):
+                print(f"\n🔍 Search: '{query}'\n")
+                for i, result in enumerate(results, 1):
+                    fmt = result["formatted"]
+                    print(f"{i}. {fmt['title']}")
+                    print(f"   arXiv: {fmt['arxiv_id']} | Section: {fmt['section']} | Score: {fmt['score']}")
+                print()
+
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        logger.info("Build an index first using: ragvix-build-index build")
+        raise typer.Exit(1)
+    except Exception as e:
+        logger.error(f"Batch search failed: {str(e)}")
+        raise typer.Exit(1)
+
+
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -1,38 +1,66 @@
 """Logging utilities for RAGvix."""
 
 import logging
+import os
+import sys
+from functools import lru_cache
 from typing import Optional
 
 from rich.console import Console
 from rich.logging import RichHandler
 
 
+def _use_plain_logs() -> bool:
+    """Whether to skip Rich formatting.
+
+    Rich parses markup and computes colors per record, which adds up in
+    hot paths; non-interactive runs don't benefit from it anyway.
+    """
+    if os.environ.get("RAGVIX_PLAIN_LOGS"):
+        return True
+    return not sys.stderr.isatty()
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get a Rich-formatted logger.
-    
+
+    Non-TTY runs (and RAGVIX_PLAIN_LOGS=1) get a plain StreamHandler
+    instead, avoiding Rich's per-record formatting cost. Memoized per
+    name so repeat calls skip the handler checks and Console setup.
+
     Args:
         name: Logger name, defaults to None
-        
+
     Returns:
         Configured logger with Rich formatting
     """
     logger = logging.getLogger(name)
-    
+
     if not logger.handlers:
-        console = Console()
-        handler = RichHandler(
-            console=console,
-            show_time=True,
-            show_path=False,
-            markup=True,
-        )
-        handler.setFormatter(
-            logging.Formatter(
-                fmt="%(message)s",
-                datefmt="[%X]",
+        if _use_plain_logs():
+            handler: logging.Handler = logging.StreamHandler()
+            handler.setFormatter(
+                logging.Formatter(
+                    fmt="%(asctime)s %(message)s",
+                    datefmt="[%X]",
+                )
+            )
+        else:
+            console = Console()
+            handler = RichHandler(
+                console=console,
+                show_time=True,
+                show_path=False,
+                markup=True,
+            )
+            handler.setFormatter(
+                logging.Formatter(
+                    fmt="%(message)s",
+                    datefmt="[%X]",
+                )
             )
-        )
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
-    
+
     return logger
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""Persistent query-embedding cache for RAGvix."""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+
+class QueryEmbeddingCache:
+    """SQLite-backed cache of query embeddings.
+
+    Query distributions are long-tailed and stable, so warming the
+    in-process cache from disk across restarts skips encoder calls for
+    the queries that dominate traffic. Keys hash (model name, query) so
+    caches never mix models; embeddings are stored as float16, halving
+    the disk footprint for a negligible inner-product accuracy cost.
+    """
+
+    def __init__(self, path: Union[str, Path], model_name: str):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        self.conn = sqlite3.connect(str(path))
+        # WAL lets concurrent query workers read while one writes
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS query_embeddings (hash BLOB PRIMARY KEY, emb BLOB)"
+        )
+
+    def _key(self, query: str) -> bytes:
+        return hashlib.blake2b(
+            (self.model_name + query).encode(), digest_size=16
+        ).digest()
+
+    def get(self, query: str) -> Optional[np.ndarray]:
+        """Look up a cached embedding.
+
+        Args:
+            query: Query text
+
+        Returns:
+            float32 embedding of shape (1, dim), or None on miss
+        """
+        row = self.conn.execute(
+            "SELECT emb FROM query_embeddings WHERE hash = ?", (self._key(query),)
+        ).fetchone()
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float16).astype(np.float32)[None, :]
+
+    def put(self, query: str, embedding: np.ndarray) -> None:
+        """Store an embedding for a query.
+
+        Args:
+            query: Query text
+            embedding: Embedding of shape (1, dim) or (dim,)
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO query_embeddings (hash, emb) VALUES (?, ?)",
+            (self._key(query), np.asarray(embedding).ravel().astype(np.float16).tobytes()),
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()